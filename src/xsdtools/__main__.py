@@ -88,18 +88,26 @@ def main():
         elif path.suffix not in ('.jinja', '.j2', '.jinja2'):
             pass
         elif path.is_file():
-            try:
-                template_files[str(path.parent)].append(path.name)
-            except KeyError:
-                template_files[str(path.parent)] = [path.name]
+            template_files.setdefault(str(path.parent), []).append(path.name)
         else:
             template_files[None].append(str(path))
 
     rendered_templates = []
     for searchpath, names in template_files.items():
+        if not names:
+            continue
+
         generator = generator_class(schema, searchpath)
+        template_names = []
+        for name in names:
+            if is_shell_wildcard(name):
+                template_names.extend(generator.matching_templates(name))
+            else:
+                template_names.append(name)
+
+        # Render each template once, also if matched by more arguments
         rendered_templates.extend(generator.render_to_files(
-            names, output_dir=args.output, force=args.force
+            list(dict.fromkeys(template_names)), output_dir=args.output, force=args.force
         ))
 
     print("Rendered n.{} files ...".format(len(rendered_templates)))
@@ -7,11 +7,14 @@
 #
 import re
 
+from xmlschema.validators import XsdType, XsdElement, XsdAttribute
 from xmlschema.extras.codegen import filter_method
 from ..fortran_generator import FortranGenerator
 
 QE_NAMESPACE = "http://www.quantum-espresso.org/ns/qes/qes-1.0"
 
+LEN_PATTERN = re.compile(r'LEN=[\d]+', flags=re.IGNORECASE)
+
 
 class QEFortranGenerator(FortranGenerator):
     """
@@ -43,6 +46,38 @@ class QEFortranGenerator(FortranGenerator):
         super(QEFortranGenerator, self).__init__(schema, searchpath, types_map)
         assert self.schema.target_namespace == QE_NAMESPACE
 
+        # Module templates include a sub-template for each XSD type: skip
+        # the up-to-date check of cached templates, that stats the file.
+        self._env.auto_reload = False
+
+        # Base types checked by filters, looked up once for all the renders
+        self._vector_types = self._get_types('vectorType', 'integerVectorType')
+        self._matrix_types = self._get_types('matrixType', 'integerMatrixType')
+        self._array_types = self._get_types('vectorType', 'integerVectorType',
+                                            'integerMatrixType')
+
+        self._types_cache = {}
+
+    def _get_types(self, *names):
+        return tuple(self.schema.types[x] for x in names if x in self.schema.types)
+
+    def map_type(self, obj):
+        """
+        Maps an XSD type to a Fortran type declaration, caching the
+        results by XSD type, because the templates map the same types
+        many times. Registered as *fortran_type* filter.
+        """
+        if isinstance(obj, (XsdAttribute, XsdElement)):
+            obj = obj.type
+        elif not isinstance(obj, XsdType):
+            return ''
+
+        fortran_type = self._types_cache.get(obj)
+        if fortran_type is None:
+            fortran_type = super(QEFortranGenerator, self).map_type(obj)
+            self._types_cache[obj] = fortran_type
+        return fortran_type
+
     @staticmethod
     @filter_method
     def bcast_function_name(xsd_type):
@@ -65,14 +100,7 @@ class QEFortranGenerator(FortranGenerator):
     def is_qes_array_type(self, xsd_type):
         if xsd_type.local_name in ("vectorType", "integerVectorType", "integerMatrixType"):
             return True
-        elif xsd_type.is_derived(self.schema.types['vectorType']):
-            return True
-        elif xsd_type.is_derived(self.schema.types['integerVectorType']):
-            return True
-        elif xsd_type.is_derived(self.schema.types['integerMatrixType']):
-            return True
-        else:
-            return False
+        return any(xsd_type.is_derived(x) for x in self._array_types)
 
     @staticmethod
     @filter_method
@@ -81,13 +109,11 @@ class QEFortranGenerator(FortranGenerator):
 
     @filter_method
     def is_matrix_type(self, xsd_type):
-        return xsd_type.is_derived(self.schema.types['matrixType']) \
-            or xsd_type.is_derived(self.schema.types['integerMatrixType'])
+        return any(xsd_type.is_derived(x) for x in self._matrix_types)
 
     @filter_method
     def is_vector_type(self, xsd_type):
-        return xsd_type.is_derived(self.schema.types['vectorType']) \
-            or xsd_type.is_derived(self.schema.types['integerVectorType'])
+        return any(xsd_type.is_derived(x) for x in self._vector_types)
 
     @staticmethod
     @filter_method
@@ -98,7 +124,7 @@ class QEFortranGenerator(FortranGenerator):
 
     @filter_method
     def init_fortran_type(self, xsd_type):
-        tmp = re.sub(r'LEN=[\d]+', 'LEN=*', self.map_type(xsd_type), flags=re.IGNORECASE)
+        tmp = LEN_PATTERN.sub('LEN=*', self.map_type(xsd_type))
         return tmp.replace(', ALLOCATABLE', '')
 
     @staticmethod
@@ -166,7 +192,6 @@ class QEFortranGenerator(FortranGenerator):
     @filter_method
     def attributes_list(self, xsd_type):
         remove = []
-        if xsd_type.is_derived(self.schema.types['matrixType']) \
-                or xsd_type.is_derived(self.schema.types['integerMatrixType']):
+        if any(xsd_type.is_derived(x) for x in self._matrix_types):
             remove += ['rank', 'dims']
         return (_ for _ in xsd_type.attributes.values() if _.local_name not in remove)
@@ -5,7 +5,8 @@
 # See the file 'LICENSE' in the root directory of the present distribution,
 # or https://opensource.org/licenses/BSD-3-Clause
 #
-from xmlschema.extras.codegen import AbstractGenerator
+from xmlschema.validators import XsdType
+from xmlschema.extras.codegen import filter_method, AbstractGenerator
 
 
 class FortranGenerator(AbstractGenerator):
@@ -26,3 +27,65 @@ class FortranGenerator(AbstractGenerator):
         'nonNegativeInteger': 'INTEGER',
         'positiveInteger': 'INTEGER',
     }
+
+    @staticmethod
+    @filter_method
+    def sort_types(xsd_types, accept_circularity=False):
+        """
+        Returns a sorted sequence of XSD types usable for building type declarations.
+        Complex types with complex content are sorted with Kahn's algorithm, one
+        dependency level at a time, keeping the order of the argument within each level.
+
+        :param xsd_types: a sequence with XSD types.
+        :param accept_circularity: if set to `True` circularities \
+        are accepted. Defaults to `False`.
+        :return: a list with ordered types.
+        """
+        if not isinstance(xsd_types, (list, tuple)):
+            try:
+                xsd_types = list(xsd_types.values())
+            except AttributeError:
+                pass
+
+        ordered_types = []
+        simple_content_types = []
+        unordered = {}
+        for xsd_type in xsd_types:
+            assert isinstance(xsd_type, XsdType)
+            if xsd_type.is_simple():
+                ordered_types.append(xsd_type)
+            elif xsd_type.has_simple_content():
+                simple_content_types.append(xsd_type)
+            else:
+                unordered[xsd_type] = set()
+
+        ordered_types.extend(simple_content_types)
+        dependants = {x: [] for x in unordered}
+        position = {x: k for k, x in enumerate(unordered)}
+
+        for xsd_type, dependencies in unordered.items():
+            for e in xsd_type.content.iter_elements():
+                if e.type in unordered and e.type not in dependencies:
+                    dependencies.add(e.type)
+                    dependants[e.type].append(xsd_type)
+
+        ready = [x for x, dependencies in unordered.items() if not dependencies]
+        while ready:
+            ordered_types.extend(ready)
+            next_ready = []
+            for xsd_type in ready:
+                for other in dependants[xsd_type]:
+                    unordered[other].discard(xsd_type)
+                    if not unordered[other]:
+                        next_ready.append(other)
+
+            next_ready.sort(key=position.__getitem__)
+            ready = next_ready
+
+        circular_types = [x for x, dependencies in unordered.items() if dependencies]
+        if circular_types:
+            if not accept_circularity:
+                raise ValueError("circularity found between {!r}".format(circular_types))
+            ordered_types.extend(circular_types)
+
+        return ordered_types
@@ -40,6 +40,27 @@ XSD_TEST = """
 </xs:schema>
 """
 
+XSD_CIRCULAR_TEST = """
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    xmlns:tns="http://codegen.test/0" targetNamespace="http://codegen.test/0">
+  <xs:complexType name="type1">
+    <xs:sequence>
+      <xs:element name="elem2" type="tns:type2" />
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="type2">
+    <xs:sequence>
+      <xs:element name="elem1" type="tns:type1" minOccurs="0" />
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="type3">
+    <xs:sequence>
+      <xs:element name="elem4" type="xs:string" />
+    </xs:sequence>
+  </xs:complexType>
+</xs:schema>
+"""
+
 
 class DemoGenerator(AbstractGenerator):
     formal_language = 'Demo'
@@ -180,6 +201,17 @@ class TestFortranGenerator(TestAbstractGenerator):
             self.generator.render('fortran_type_filter_test.jinja'), ['CHARACTER(len=256)']
         )
 
+    def test_sort_types_circularity(self):
+        schema = XMLSchema(XSD_CIRCULAR_TEST)
+        xsd_types = schema.types
+        with self.assertRaises(ValueError):
+            self.generator.filters['sort_types'](xsd_types)
+
+        self.assertListEqual(
+            self.generator.filters['sort_types'](xsd_types, accept_circularity=True),
+            [xsd_types['type3'], xsd_types['type1'], xsd_types['type2']]
+        )
+
     def test_get_template(self):
         codegen = FortranGenerator(self.schema)
         template = codegen.get_template('base.f90.jinja')
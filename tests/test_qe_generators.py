@@ -41,6 +41,7 @@ class TestQEFortranGenerator(unittest.TestCase):
         codegen = QEFortranGenerator(str(self.xsd_file))
         self.assertIsInstance(codegen.schema, xmlschema.XMLSchema11)
         self.assertIsInstance(codegen._env, jinja2.Environment)
+        self.assertFalse(codegen._env.auto_reload)
 
     def test_get_template(self):
         codegen = QEFortranGenerator(self.schema)
@@ -60,6 +61,14 @@ class TestQEFortranGenerator(unittest.TestCase):
         with open(template.filename) as fp:
             self.assertIn("{# Override base90.f90 template #}", fp.read())
 
+    def test_fortran_type_filter(self):
+        codegen = QEFortranGenerator(self.schema)
+        xsd_type = self.schema.types['vectorType']
+        self.assertEqual(codegen.filters['fortran_type'](xsd_type),
+                         'REAL(DP), DIMENSION(:), ALLOCATABLE')
+        self.assertIn(xsd_type, codegen._types_cache)
+        self.assertEqual(codegen.filters['fortran_type'](None), '')
+
     def test_list_templates(self):
         codegen = QEFortranGenerator(self.schema)
         templates = codegen.list_templates()